@@ -2,15 +2,30 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import os
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from binascii import hexlify, unhexlify
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from mnemonic import Mnemonic
 from nacl import bindings
+from nacl.exceptions import CryptoError
 
+try:
+    from ed25519consensus import BatchVerifier  # type: ignore
 
-__all__ = ["BIP32ED25519PrivateKey", "BIP32ED25519PublicKey", "HDWallet"]
+    _HAS_BATCH_VERIFIER = True
+except ImportError:
+    _HAS_BATCH_VERIFIER = False
+
+
+__all__ = [
+    "BIP32ED25519PrivateKey",
+    "BIP32ED25519PublicKey",
+    "HDWallet",
+    "batch_scalarmult_base",
+]
 
 
 SUPPORTED_MNEMONIC_LANGS = {
@@ -24,27 +39,98 @@ SUPPORTED_MNEMONIC_LANGS = {
     "spanish",
 }
 
+_SCALAR_ONE = (1).to_bytes(32, "little")
+
+# Message size above which copy-free verification beats crypto_sign_open's
+# concatenate-and-verify; see BIP32ED25519PublicKey.verify.
+_COPY_FREE_VERIFY_THRESHOLD = 128 * 1024
+
+
+def _is_canonical_scalar(s: bytes) -> bool:
+    # A canonical scalar is already fully reduced mod L.
+    return bindings.crypto_core_ed25519_scalar_reduce(s + bytes(32)) == s
+
+
+def _is_prime_order_point(p: bytes) -> bool:
+    # crypto_scalarmult_ed25519_noclamp rejects non-canonical encodings,
+    # points off the curve and small-order points; multiplying by 1 leaves
+    # a valid point unchanged, making this a pure validity check.
+    try:
+        bindings.crypto_scalarmult_ed25519_noclamp(_SCALAR_ONE, p)
+    except CryptoError:
+        return False
+    return True
+
+
 class BIP32ED25519PrivateKey:
     def __init__(self, private_key: bytes, chain_code: bytes):
         self.private_key = private_key
         self.left = self.private_key[:32]
         self.right = self.private_key[32:]
         self.chain_code = chain_code
-        self.public_key = bindings.crypto_scalarmult_ed25519_base_noclamp(self.left)
+        self._public_key: Optional[bytes] = None
+        self._pub_mv: Optional[memoryview] = None
+        # memoryviews avoid re-copying the fixed key material into the
+        # concatenated hash inputs on every sign call.
+        self._right_mv = memoryview(self.private_key)[32:]
+        # self.right never changes, so its SHA-512 midstate can be absorbed
+        # once and cheaply cloned per signature.
+        self._r_hasher = hashlib.sha512()
+        self._r_hasher.update(self._right_mv)
+
+    @property
+    def public_key(self) -> bytes:
+        # Computed on first access so that constructing a key (e.g. as an
+        # intermediate node during child derivation) doesn't pay for a base
+        # scalarmult it may never use.
+        pk = self._public_key
+        if pk is None:
+            pk = bindings.crypto_scalarmult_ed25519_base_noclamp(self.left)
+            self._public_key = pk
+            self._pub_mv = memoryview(pk)
+        return pk
 
     def sign(self, message: bytes) -> bytes:
-        r = bindings.crypto_core_ed25519_scalar_reduce(
-            hashlib.sha512(self.right + message).digest(),
-        )
+        h = self._r_hasher.copy()
+        h.update(message)
+        r = bindings.crypto_core_ed25519_scalar_reduce(h.digest())
         R = bindings.crypto_scalarmult_ed25519_base_noclamp(r)
-        hram = bindings.crypto_core_ed25519_scalar_reduce(
-            hashlib.sha512(R + self.public_key + message).digest(),
-        )
+        if self._pub_mv is None:
+            self.public_key
+        h = hashlib.sha512()
+        h.update(R)
+        h.update(self._pub_mv)
+        h.update(message)
+        hram = bindings.crypto_core_ed25519_scalar_reduce(h.digest())
         S = bindings.crypto_core_ed25519_scalar_add(
             bindings.crypto_core_ed25519_scalar_mul(hram, self.left),
             r,
         )
         return R + S
+
+    def sign_many(self, messages: Sequence[bytes]) -> List[bytes]:
+        """Sign a batch of messages concurrently.
+
+        Each signature spends most of its time inside libsodium and OpenSSL,
+        both of which release the GIL, so independent messages are signed in
+        parallel across a thread pool for bulk workloads (e.g. batch
+        transaction submission).
+
+        Args:
+            messages (Sequence[bytes]): Messages to sign.
+
+        Returns:
+            List[bytes]: 64-byte signatures, in message order.
+        """
+        if len(messages) < 2:
+            return [self.sign(m) for m in messages]
+        # Populate the lazy public key before handing sign to the pool so the
+        # worker threads don't race its first computation.
+        self.public_key
+        with ThreadPoolExecutor(
+            max_workers=min(len(messages), os.cpu_count() or 1)
+        ) as pool:
+            return list(pool.map(self.sign, messages))
     
 
 class BIP32ED25519PublicKey:
@@ -59,8 +145,122 @@ class BIP32ED25519PublicKey:
     ) -> BIP32ED25519PublicKey:
         return cls(private_key.public_key, private_key.chain_code)
 
-    def verify(self, signature, message):
-        return bindings.crypto_sign_open(signature + message, self.public_key)
-    
+    def verify(self, signature, message) -> bool:
+        # crypto_sign_open concatenates the signature with the message (a full
+        # copy per call) but runs the curve work in one optimized C call, which
+        # wins for anything transaction-sized. Only once the message is large
+        # enough that the copy dominates does checking [s]B == R + [h]A from
+        # individual point/scalar calls pay off; the crossover is around
+        # 100-200 KiB depending on the machine.
+        if len(message) < _COPY_FREE_VERIFY_THRESHOLD:
+            try:
+                bindings.crypto_sign_open(signature + message, self.public_key)
+            except CryptoError:
+                return False
+            return True
+        if len(signature) != 64:
+            return False
+        R, s = signature[:32], signature[32:]
+        # Match crypto_sign_open's strictness: reject non-canonical s (s >= L)
+        # and non-canonical or small-order R. The [h]A scalar-mul below
+        # already rejects bad A, but R otherwise only passes through point
+        # addition, which would accept small-order encodings.
+        if not _is_canonical_scalar(s):
+            return False
+        if not _is_prime_order_point(R):
+            return False
+        h = hashlib.sha512()
+        h.update(R)
+        h.update(self.public_key)
+        h.update(message)
+        hram = bindings.crypto_core_ed25519_scalar_reduce(h.digest())
+        try:
+            expected = bindings.crypto_core_ed25519_add(
+                R,
+                bindings.crypto_scalarmult_ed25519_noclamp(hram, self.public_key),
+            )
+            return bindings.crypto_scalarmult_ed25519_base_noclamp(s) == expected
+        except CryptoError:
+            return False
+
+    @classmethod
+    def verify_batch(
+        cls,
+        signatures: Sequence[bytes],
+        messages: Sequence[bytes],
+        public_keys: Sequence[bytes],
+    ) -> bool:
+        """Verify a batch of Ed25519 signatures.
+
+        When the optional ``ed25519consensus`` package is installed, all
+        signatures are combined into one random linear combination and checked
+        with a single multi-scalar multiplication, which amortizes the curve
+        arithmetic across the batch and is significantly faster than N
+        independent verifications. Without it, signatures are verified
+        serially with libsodium: libsodium exposes no multi-scalar
+        multiplication, so emulating the batch equation from individual
+        point/scalar calls costs more than just looping the serial verifier.
+
+        Args:
+            signatures (Sequence[bytes]): 64-byte signatures (R || S).
+            messages (Sequence[bytes]): Messages, one per signature.
+            public_keys (Sequence[bytes]): 32-byte public keys, one per signature.
+
+        Returns:
+            bool: True if every signature in the batch is valid, False otherwise.
+        """
+        if not len(signatures) == len(messages) == len(public_keys):
+            raise ValueError(
+                "signatures, messages and public_keys must have the same length."
+            )
+        if not signatures:
+            return True
+
+        if _HAS_BATCH_VERIFIER:
+            verifier = BatchVerifier()
+            for signature, message, public_key in zip(
+                signatures, messages, public_keys
+            ):
+                verifier.add(public_key, message, signature)
+            return verifier.verify()
+
+        for signature, message, public_key in zip(
+            signatures, messages, public_keys
+        ):
+            try:
+                bindings.crypto_sign_open(signature + message, public_key)
+            except CryptoError:
+                return False
+        return True
+
+
+def batch_scalarmult_base(scalars: Sequence[bytes]) -> List[bytes]:
+    """Compute the base-point multiplication [s]B for a batch of scalars.
+
+    libsodium's fixed-base scalarmult already uses precomputed tables
+    internally and releases the GIL for the duration of the call, so bulk
+    derivations (e.g. a wallet scan deriving many child public keys) are
+    overlapped across a thread pool instead of running serially.
+
+    Args:
+        scalars (Sequence[bytes]): 32-byte scalars.
+
+    Returns:
+        List[bytes]: The corresponding compressed Ed25519 points, in order.
+    """
+    if len(scalars) < 2:
+        return [
+            bindings.crypto_scalarmult_ed25519_base_noclamp(s) for s in scalars
+        ]
+    with ThreadPoolExecutor(
+        max_workers=min(len(scalars), os.cpu_count() or 1)
+    ) as pool:
+        return list(
+            pool.map(bindings.crypto_scalarmult_ed25519_base_noclamp, scalars)
+        )
+
+
 def _Fk(message, secret):
-    return hmac.new(secret, message, hashlib.sha512).digest()
\ No newline at end of file
+    # hmac.digest dispatches straight to OpenSSL's one-shot HMAC, skipping the
+    # Python-side HMAC object construction hmac.new would pay per call.
+    return hmac.digest(secret, message, "sha512")
\ No newline at end of file
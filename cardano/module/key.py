@@ -1,7 +1,7 @@
 from __future__ import annotations
 import json
 import os
-from typing import Optional, Type
+from typing import Optional, Sequence, Type
 from .serialization import CBORSerializable,limit_primitive_type
 from .exception import InvalidKeyTypeException
 from nacl.signing import SigningKey as NACLSigningKey
@@ -9,9 +9,20 @@ from .hash import VerificationKeyHash,VERIFICATION_KEY_HASH_SIZE
 from nacl.public import PrivateKey
 from nacl.encoding import RawEncoder
 from nacl.hash import blake2b
-from .crypto.bip32 import BIP32ED25519PrivateKey
+from .crypto.bip32 import BIP32ED25519PrivateKey, BIP32ED25519PublicKey
 
+try:
+    # orjson parses and emits JSON several times faster than stdlib json,
+    # which adds up for tools that load many key files on startup.
+    import orjson
 
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
 
 
 
@@ -78,7 +89,7 @@ class Key(CBORSerializable):
         Returns:
             str: JSON representation of the key.
         """
-        return json.dumps(
+        return _json_dumps(
             {
                 "type": self.key_type,
                 "description": self.description,
@@ -102,7 +113,7 @@ class Key(CBORSerializable):
             InvalidKeyTypeException: When `validate_type=True` and the type in json is not equal to the default type
                 of the Key class used.
         """
-        obj = json.loads(data)
+        obj = _json_loads(data)
 
         if validate_type and obj["type"] != cls.KEY_TYPE:
             raise InvalidKeyTypeException(
@@ -135,14 +146,18 @@ class Key(CBORSerializable):
         return self.payload
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Key):
             return False
-        else:
-            return (
-                self.payload == other.payload
-                and self.description == other.description
-                and self.key_type == other.key_type
-            )
+        # Compare payloads first (the discriminating field) and read the
+        # underscore attributes directly to skip the property descriptors;
+        # keys are used as dict/set members where __eq__ runs often.
+        return (
+            self._payload == other._payload
+            and self._key_type == other._key_type
+            and self._description == other._description
+        )
         
     def __repr__(self) -> str:
         return self.to_json()
@@ -165,7 +180,28 @@ class VerificationKey(Key):
     @classmethod
     def from_signing_key(cls, key: SigningKey) -> VerificationKey:
         return key.to_verification_key()
-    
+
+    @classmethod
+    def verify_batch(
+        cls,
+        signatures: Sequence[bytes],
+        messages: Sequence[bytes],
+        verification_keys: Sequence[VerificationKey],
+    ) -> bool:
+        """Verify a batch of signatures in a single batch equation.
+
+        Args:
+            signatures (Sequence[bytes]): 64-byte signatures.
+            messages (Sequence[bytes]): Messages, one per signature.
+            verification_keys (Sequence[VerificationKey]): Keys, one per signature.
+
+        Returns:
+            bool: True if every signature in the batch is valid, False otherwise.
+        """
+        return BIP32ED25519PublicKey.verify_batch(
+            signatures, messages, [key.payload for key in verification_keys]
+        )
+
 class ExtendedVerificationKey(Key):
     def hash(self) -> VerificationKeyHash:
         """Compute a blake2b hash from the key, excluding chain code
@@ -187,11 +223,55 @@ class ExtendedVerificationKey(Key):
         """
         return VerificationKey(self.payload[:32])
 
+    @classmethod
+    def verify_batch(
+        cls,
+        signatures: Sequence[bytes],
+        messages: Sequence[bytes],
+        verification_keys: Sequence[ExtendedVerificationKey],
+    ) -> bool:
+        """Verify a batch of signatures in a single batch equation, with chain codes
+        trimmed off.
+
+        Args:
+            signatures (Sequence[bytes]): 64-byte signatures.
+            messages (Sequence[bytes]): Messages, one per signature.
+            verification_keys (Sequence[ExtendedVerificationKey]): Keys, one per signature.
+
+        Returns:
+            bool: True if every signature in the batch is valid, False otherwise.
+        """
+        return BIP32ED25519PublicKey.verify_batch(
+            signatures, messages, [key.payload[:32] for key in verification_keys]
+        )
+
     
 class ExtendedSigningKey(Key):
+    def _get_signer(self) -> BIP32ED25519PrivateKey:
+        # The payload never changes, so the BIP32 signer (and the 160-byte
+        # payload slices its constructor takes) is built once and reused
+        # across sign calls instead of being rebuilt per signature.
+        private_key = self.__dict__.get("_bip32_signer")
+        if private_key is None:
+            private_key = BIP32ED25519PrivateKey(
+                self._payload[:64], self._payload[96:]
+            )
+            self._bip32_signer = private_key
+        return private_key
+
     def sign(self, data: bytes) -> bytes:
-        private_key = BIP32ED25519PrivateKey(self.payload[:64], self.payload[96:])
-        return private_key.sign(data)
+        return self._get_signer().sign(data)
+
+    def sign_many(self, data: Sequence[bytes]) -> list:
+        """Sign a batch of messages, parallelized across a thread pool.
+
+        Args:
+            data (Sequence[bytes]): Messages to sign.
+
+        Returns:
+            list: Signatures, in message order.
+        """
+        return self._get_signer().sign_many(data)
     
     def to_verification_key(self) -> ExtendedVerificationKey:
         return ExtendedVerificationKey(
@@ -159,89 +159,49 @@ class CBORSerializable:
             SerializeException: When the object or its elements could not be converted to
                 CBOR primitive types.
         """
-        result = self.to_shallow_primitive()
+        return _to_primitive_dfs(self.to_shallow_primitive())
+
+    @classmethod
+    def _get_type_hints(cls) -> Dict[str, Any]:
+        """Resolve and cache this class's type hints.
+
+        get_type_hints re-evaluates every annotation on each call, which is
+        expensive; the result never changes for a class, so it is computed once
+        and stored on the class itself (cls.__dict__, so subclasses don't
+        inherit a parent's cache).
+        """
+        hints = cls.__dict__.get("_resolved_type_hints")
+        if hints is None:
+            hints = get_type_hints(cls)
+            cls._resolved_type_hints = hints
+        return hints
+
+    @classmethod
+    def _get_field_checkers(cls) -> List[tuple]:
+        """Compile and cache per-field type checkers for this class.
+
+        Interpreting the annotation tree per instance is expensive; the tree
+        never changes for a class, so it is compiled into closures once (see
+        :func:`_compile_checker`) and stored on the class itself.
+        """
+        checkers = cls.__dict__.get("_field_checkers")
+        if checkers is None:
+            checkers = [
+                (field_name, field_type, _compile_checker(field_type))
+                for field_name, field_type in cls._get_type_hints().items()
+            ]
+            cls._field_checkers = checkers
+        return checkers
 
-        def _dfs(value, freeze=False):
-            if isinstance(value, CBORSerializable):
-                return _dfs(value.to_primitive(), freeze)
-            elif isinstance(value, (dict, OrderedDict, defaultdict)):
-                _dict = type(value)()
-                if hasattr(value, "default_factory"):
-                    _dict.setdefault(value.default_factory)
-                for k, v in value.items():
-                    _dict[_dfs(k, freeze=True)] = _dfs(v, freeze)
-                if freeze:
-                    return frozendict(_dict)
-                return _dict
-            elif isinstance(value, set):
-                _set = set(_dfs(v, freeze=True) for v in value)
-                if freeze:
-                    return frozenset(_set)
-                return _set
-            elif isinstance(value, tuple):
-                return tuple(_dfs(v, freeze) for v in value)
-            elif isinstance(value, list):
-                _list = [_dfs(v, freeze) for v in value]
-                if freeze:
-                    fl = FrozenList(_list)
-                    fl.freeze()
-                    return fl
-                return _list
-            elif isinstance(value, IndefiniteList):
-                _list = [_dfs(v, freeze) for v in value]
-                if freeze:
-                    fl = IndefiniteFrozenList(_list)
-                    fl.freeze()
-                    return fl
-                return IndefiniteList(_list)
-            elif isinstance(value, CBORTag):
-                return CBORTag(value.tag, _dfs(value.value, freeze))
-            else:
-                return value
-
-        return _dfs(result)
-    
     def validate(self):
         """Validate the data stored in the current instance. Defaults to always pass.
 
         Raises:
             InvalidDataException: When the data is invalid.
         """
-        type_hints = get_type_hints(self.__class__)
-
-        def _check_recursive(value, type_hint):
-            if type_hint is Any:
-                return True
-            origin = getattr(type_hint, "__origin__", None)
-            if origin is None:
-                if isinstance(value, CBORSerializable):
-                    value.validate()
-                return isinstance(value, type_hint)
-            elif origin is ClassVar:
-                return _check_recursive(value, type_hint.__args__[0])
-            elif origin is Union:
-                return any(_check_recursive(value, arg) for arg in type_hint.__args__)
-            elif origin is Dict or isinstance(value, (dict, frozendict)):
-                key_type, value_type = type_hint.__args__
-                return all(
-                    _check_recursive(k, key_type) and _check_recursive(v, value_type)
-                    for k, v in value.items()
-                )
-            elif origin in (list, set, tuple):
-                if value is None:
-                    return True
-                args = type_hint.__args__
-                if len(args) == 1:
-                    return all(_check_recursive(item, args[0]) for item in value)
-                elif len(args) > 1:
-                    return all(
-                        _check_recursive(item, arg) for item, arg in zip(value, args)
-                    )
-            return True  # We don't know how to check this type
-
-        for field_name, field_type in type_hints.items():
+        for field_name, field_type, checker in self.__class__._get_field_checkers():
             field_value = getattr(self, field_name)
-            if not _check_recursive(field_value, field_type):
+            if not checker(field_value):
                 raise TypeError(
                     f"Field '{field_name}' should be of type {field_type}, "
                     f"got {repr(field_value)} instead."
@@ -378,48 +338,260 @@ class CBORSerializable:
             TestParent(3, Test(1, 2))
 
         """
-        if type(payload) == str:
+        if isinstance(payload, str):
             payload = bytes.fromhex(payload)
+        return cls.from_cbor_bytes(payload)
+
+    @classmethod
+    def from_cbor_bytes(cls, payload: bytes) -> 'CBORSerializable':
+        """Restore a CBORSerializable object from CBOR bytes.
+
+        A fast path of :meth:`from_cbor` for callers that already hold bytes,
+        skipping the hex-string check in tight decode loops.
+
+        Args:
+            payload (bytes): CBOR bytes to restore from.
+
+        Returns:
+            CBORSerializable: Restored CBORSerializable object.
+        """
         value = loads(payload)
         return cls.from_primitive(value)
 
     def __repr__(self):
         return pformat(vars(self), indent=2)
-    
+
+
+# freeze is requested only where the result must be hashable: dict keys and
+# set members. It then has to propagate into nested values (a frozendict used
+# as a key hashes its values too), but containers in plain value positions are
+# never wrapped, so ordinary serialization pays no frozendict/FrozenList cost.
+def _check_always(value):
+    return True
+
+
+def _compile_checker(type_hint) -> Callable[[Any], bool]:
+    """Compile a type hint into a closure that checks a value against it.
+
+    The closures mirror the recursive interpretation validate used to do
+    inline, but all annotation introspection happens here, once per hint,
+    instead of on every validated instance.
+    """
+    if type_hint is Any:
+        return _check_always
+    origin = getattr(type_hint, "__origin__", None)
+    if origin is None:
+
+        def _check_plain(value):
+            if isinstance(value, CBORSerializable):
+                value.validate()
+            return isinstance(value, type_hint)
+
+        return _check_plain
+    if origin is ClassVar:
+        return _compile_checker(type_hint.__args__[0])
+    if origin is Union:
+        checkers = tuple(_compile_checker(arg) for arg in type_hint.__args__)
+
+        def _check_union(value):
+            return any(checker(value) for checker in checkers)
+
+        return _check_union
+    if origin in (dict, Dict):
+        key_checker, value_checker = (
+            _compile_checker(arg) for arg in type_hint.__args__
+        )
+
+        def _check_dict(value):
+            # Non-dict values passed the old interpreter unchecked (it only
+            # inspected key/value args when the value was dict-like), so stay
+            # lenient here; a Union's NoneType arm in particular must not
+            # crash on value.items().
+            if isinstance(value, (dict, frozendict)):
+                return all(
+                    key_checker(k) and value_checker(v) for k, v in value.items()
+                )
+            return True
+
+        return _check_dict
+    if origin in (list, set, tuple):
+        args = type_hint.__args__
+        if len(args) == 1:
+            item_checker = _compile_checker(args[0])
+
+            def _check_homogeneous(value):
+                if value is None:
+                    return True
+                return all(item_checker(item) for item in value)
+
+            return _check_homogeneous
+        item_checkers = tuple(_compile_checker(arg) for arg in args)
+
+        def _check_heterogeneous(value):
+            if value is None:
+                return True
+            return all(
+                checker(item) for item, checker in zip(value, item_checkers)
+            )
+
+        return _check_heterogeneous
+    if len(getattr(type_hint, "__args__", ())) == 2:
+        # Unknown two-argument generics (e.g. frozendict-style mappings) used
+        # to be checked as key/value pairs when the value was dict-like.
+        key_checker, value_checker = (
+            _compile_checker(arg) for arg in type_hint.__args__
+        )
+
+        def _check_mapping_like(value):
+            if isinstance(value, (dict, frozendict)):
+                return all(
+                    key_checker(k) and value_checker(v) for k, v in value.items()
+                )
+            return True
+
+        return _check_mapping_like
+    return _check_always  # We don't know how to check this type
+
+
+def _dfs_dict(value, freeze):
+    _dict = type(value)()
+    if hasattr(value, "default_factory"):
+        _dict.setdefault(value.default_factory)
+    for k, v in value.items():
+        _dict[_to_primitive_dfs(k, freeze=True)] = _to_primitive_dfs(v, freeze)
+    if freeze:
+        return frozendict(_dict)
+    return _dict
+
+
+def _dfs_set(value, freeze):
+    if freeze:
+        return frozenset(_to_primitive_dfs(v, freeze=True) for v in value)
+    return set(_to_primitive_dfs(v, freeze=True) for v in value)
+
+
+def _dfs_tuple(value, freeze):
+    return tuple(_to_primitive_dfs(v, freeze) for v in value)
+
+
+def _dfs_list(value, freeze):
+    if freeze:
+        # A frozen list only needs to be hashable and ordered; tuple gives
+        # both at built-in construction cost and encodes to the same CBOR
+        # array, without FrozenList's Python-level freeze bookkeeping.
+        return tuple(_to_primitive_dfs(v, freeze) for v in value)
+    return [_to_primitive_dfs(v, freeze) for v in value]
+
+
+def _dfs_indefinite_list(value, freeze):
+    _list = [_to_primitive_dfs(v, freeze) for v in value]
+    if freeze:
+        fl = IndefiniteFrozenList(_list)
+        fl.freeze()
+        return fl
+    return IndefiniteList(_list)
+
+
+def _dfs_tag(value, freeze):
+    return CBORTag(value.tag, _to_primitive_dfs(value.value, freeze))
+
+
+_DFS_HANDLERS = {
+    dict: _dfs_dict,
+    OrderedDict: _dfs_dict,
+    defaultdict: _dfs_dict,
+    set: _dfs_set,
+    tuple: _dfs_tuple,
+    list: _dfs_list,
+    IndefiniteList: _dfs_indefinite_list,
+    IndefiniteFrozenList: _dfs_indefinite_list,
+    CBORTag: _dfs_tag,
+}
+
+
+def _to_primitive_dfs(value, freeze=False):
+    # Exact-type dispatch avoids walking an isinstance chain (and each type's
+    # MRO) for every node of the primitive tree; subclasses of the container
+    # types are rare and fall through to the slow path below.
+    handler = _DFS_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value, freeze)
+    if isinstance(value, CBORSerializable):
+        return _to_primitive_dfs(value.to_primitive(), freeze)
+    if isinstance(value, (dict, OrderedDict, defaultdict)):
+        return _dfs_dict(value, freeze)
+    if isinstance(value, set):
+        return _dfs_set(value, freeze)
+    if isinstance(value, tuple):
+        return _dfs_tuple(value, freeze)
+    if isinstance(value, list):
+        return _dfs_list(value, freeze)
+    if isinstance(value, IndefiniteList):
+        return _dfs_indefinite_list(value, freeze)
+    if isinstance(value, CBORTag):
+        return _dfs_tag(value, freeze)
+    return value
+
+
 
 
     
 
+def _encode_indefinite_list(encoder, value):
+    # Currently, cbor2 doesn't support indefinite list, therefore we need special
+    # handling here to explicitly write header (b'\x9f'), each body item, and footer (b'\xff') to
+    # the output bytestring.
+    encoder.write(b"\x9f")
+    for item in value:
+        encoder.encode(item)
+    encoder.write(b"\xff")
+
+
+def _encode_raw_cbor(encoder, value):
+    encoder.write(value.cbor)
+
+
+def _encode_frozen_list(encoder, value):
+    # Emit the array header and items directly instead of copying the frozen
+    # container into a throwaway list for cbor2's native encoder.
+    encoder.encode_array(value)
+
+
+def _encode_frozen_dict(encoder, value):
+    encoder.encode_map(value)
+
+
+_ENCODER_DISPATCH = {
+    IndefiniteList: _encode_indefinite_list,
+    IndefiniteFrozenList: _encode_indefinite_list,
+    RawCBOR: _encode_raw_cbor,
+    FrozenList: _encode_frozen_list,
+    frozendict: _encode_frozen_dict,
+}
+
+
 def default_encoder(
     encoder: CBOREncoder, value: Union[CBORSerializable, IndefiniteList]
 ):
     """A fallback function that encodes CBORSerializable to CBOR"""
-    assert isinstance(
-        value,
-        (
-            CBORSerializable,
-            IndefiniteList,
-            RawCBOR,
-            FrozenList,
-            IndefiniteFrozenList,
-            frozendict,
-        ),
-    ), (
-        f"Type of input value is not CBORSerializable, " f"got {type(value)} instead."
-    )
-    if isinstance(value, (IndefiniteList, IndefiniteFrozenList)):
-        # Currently, cbor2 doesn't support indefinite list, therefore we need special
-        # handling here to explicitly write header (b'\x9f'), each body item, and footer (b'\xff') to
-        # the output bytestring.
-        encoder.write(b"\x9f")
-        for item in value:
-            encoder.encode(item)
-        encoder.write(b"\xff")
+    # cbor2 funnels every non-native value through here, so dispatch on exact
+    # type first; only subclasses of the special-cased containers fall through
+    # to the isinstance chain.
+    handler = _ENCODER_DISPATCH.get(type(value))
+    if handler is not None:
+        handler(encoder, value)
+    elif isinstance(value, CBORSerializable):
+        encoder.encode(value.to_validated_primitive())
+    elif isinstance(value, (IndefiniteList, IndefiniteFrozenList)):
+        _encode_indefinite_list(encoder, value)
     elif isinstance(value, RawCBOR):
-        encoder.write(value.cbor)
+        _encode_raw_cbor(encoder, value)
     elif isinstance(value, FrozenList):
-        encoder.encode(list(value))
+        _encode_frozen_list(encoder, value)
     elif isinstance(value, frozendict):
-        encoder.encode(dict(value))
+        _encode_frozen_dict(encoder, value)
     else:
-        encoder.encode(value.to_validated_primitive())
\ No newline at end of file
+        raise AssertionError(
+            f"Type of input value is not CBORSerializable, "
+            f"got {type(value)} instead."
+        )
\ No newline at end of file
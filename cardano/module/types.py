@@ -6,9 +6,20 @@ import typeguard
 
 JsonDict = Dict[str, Any]
 
+# Runtime type checking walks the full annotations of every decorated method
+# on each call, which is far too expensive for the serialization hot path.
+# It is therefore off by default and only enabled explicitly via
+# PYCARDANO_TYPE_CHECK (e.g. in development and CI). The flag is read once at
+# import time so per-call sites don't repeat the environment lookup and
+# string normalization.
+_TYPE_CHECK_ENABLED = os.getenv("PYCARDANO_TYPE_CHECK", "False").lower() in (
+    "true",
+    "1",
+)
+
 
 def typechecked(func=None, *args, **kwargs):
-    if os.getenv("PYCARDANO_NO_TYPE_CHECK", "False").lower() in ("true", "1"):
+    if not _TYPE_CHECK_ENABLED:
         if func is None:
             return partial(typechecked, *args, **kwargs)
         return func
@@ -16,6 +27,6 @@ def typechecked(func=None, *args, **kwargs):
 
 
 def check_type(*args, **kwargs):
-    if os.getenv("PYCARDANO_NO_TYPE_CHECK", "False").lower() in ("true", "1"):
+    if not _TYPE_CHECK_ENABLED:
         return None
     return typeguard.check_type(*args, **kwargs)